@@ -12,6 +12,6 @@ from abc import ABCMeta
 class Aligner(object):
     __metaclass__ = ABCMeta
 
-    @staticmethod
-    def supports_mix():
-        return False
+    # whether the aligner can take unpaired and paired-end input in a
+    # single invocation; subclasses that can set this to True
+    supports_mix = False
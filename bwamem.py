@@ -100,7 +100,3 @@ class BwaMem(Aligner):
         self.pipe = Popen(cmd, shell=True,
                           stdin=popen_stdin, stdout=popen_stdout, stderr=popen_stderr,
                           bufsize=-1, close_fds='posix' in sys.builtin_module_names)
-
-    @staticmethod
-    def supports_mix():
-        return False
@@ -5,7 +5,6 @@ FeatureTableReader
 """
 
 import os
-import warnings
 import math
 import numpy as np
 try:
@@ -53,12 +52,12 @@ class FeatureTableReader(object):
             difference columns with small values. """
 
         def _fill_nas(_df, nm):
-            with warnings.catch_warnings(record=True) as w:
-                _df[nm] = _df[nm].fillna(np.nanmax(_df[nm])+1).fillna(0)
-                if len(w) > 0:
-                    assert len(w) == 1
-                    assert issubclass(w[0].category, RuntimeWarning)
-                    _df[nm] = _df[nm].fillna(0)
+            mask = np.isnan(_df[nm].values)
+            if not mask.any():
+                return
+            # fill with a value one above the column max, or 0 if the
+            # column is nothing but NAs
+            _df[nm] = _df[nm].fillna(0.0 if mask.all() else np.nanmax(_df[nm].values) + 1)
 
         if df.shape[0] == 0:
             return
@@ -74,7 +73,7 @@ class FeatureTableReader(object):
         """ Return an iterator over chunks of rows from the data frame. """
         assert sn in self.readers
         self.readers[sn].reset()
-        return imap(lambda x: self._postprocess_data_frame(x), self.readers[sn])
+        return imap(self._postprocess_data_frame, self.readers[sn])
 
     def __contains__(self, o):
         return o in self.readers
@@ -16,10 +16,6 @@ import os
 import sys
 import multiprocessing
 from sklearn import cross_validation
-try:
-    import itertools.izip as zip
-except ImportError:
-    pass
 
 # qtip imports
 from predictions import MapqPredictions
@@ -47,13 +43,14 @@ def _clamp_predictions(pcor, min_pcor=0.0, max_pcor=0.999999):
 
 def postprocess_predictions(pcor_test, dataset_name, max_pcor=0.999999, log=logging):
     """ Deal with pcors equal to 1.0, which cause infinite MAPQs """
-    mn, mx = min(pcor_test), max(pcor_test)
+    pcor_test = np.asarray(pcor_test)
+    mn, mx = pcor_test.min(), pcor_test.max()
     if mx >= 1.0:
         if mn == mx:
             log.warning('All data points for %s are predicted correct; results unreliable' % dataset_name)
-            pcor_test = [max_pcor] * len(pcor_test)
-        max_noninf_pcor_test = max(filter(lambda x: x < 1.0, pcor_test))
-        pcor_test = [max_noninf_pcor_test + 1e-6 if p >= 1.0 else p for p in pcor_test]
+            pcor_test = np.full(len(pcor_test), max_pcor)
+        max_noninf_pcor_test = pcor_test[pcor_test < 1.0].max()
+        pcor_test = np.where(pcor_test >= 1.0, max_noninf_pcor_test + 1e-6, pcor_test)
     return _clamp_predictions(pcor_test, 0.0, max_pcor)
 
 
@@ -86,12 +83,10 @@ def _df_to_mat(data, shortname, training, training_labs, log=logging, include_ma
         labs = training_labs[shortname]
         for lab in labs:
             assert lab in data, "Column %s in training data, but not in test (%s)" % (lab, shortname)
-    for lab in labs:
-        assert not np.isnan(data[lab]).any()
     data_mat = data[labs].values
     assert not np.isinf(data_mat).any() and not np.isnan(data_mat).any()
-    correct = np.array(data['correct'], dtype=int)
-    return data_mat, data['id'], np.array(data['mapq'], dtype=int), correct, labs
+    correct = np.asarray(data['correct'], dtype=int)
+    return data_mat, data['id'], np.asarray(data['mapq'], dtype=int), correct, labs
 
 
 _prediction_worker_queue = multiprocessing.Queue()
@@ -250,8 +245,6 @@ class MapqFit:
             train = pandas.concat([x for x in dfs.dataset_iter(ds)])
             if train.shape[0] == 0:
                 continue  # empty
-            train.correct = train.correct.astype(int)
-            train.mapq = train.mapq.astype(int)
             if train['correct'].nunique() == 1:
                 logging.warning('Warning: All training data has correct=%d.  This might mean '
                                 'the qtip software is making a mistake.  It could also '
@@ -269,6 +262,10 @@ class MapqFit:
                 x_train, mapq_orig_train, y_train = \
                     self._subsample(x_train, mapq_orig_train, y_train, frac)
                 log.info('  Now has %d rows' % x_train.shape[0])
+            # the training records now exist only as the feature matrix; drop
+            # the data frame so we don't hold two copies while fitting
+            del train
+            gc.collect()
             # use cross-validation to pick a model
             log.info('Fitting %d %s training records; %d features each' % (x_train.shape[0], ds_long, x_train.shape[1]))
             assert x_train.shape[0] == y_train.shape[0]
@@ -373,20 +370,19 @@ class MapqFit:
         file with given prefix.
         """
         for ds, model in sorted(self.trained_models.items()):
-            with open(prefix + '_' + ds + '.csv', 'w') as fh:
-                assert len(self.col_names[ds]) == len(model.feature_importances_)
-                ranks = np.argsort(model.feature_importances_)[::-1]
-                inv_ranks = [0] * ranks.shape[0]
-                for i, r in enumerate(np.nditer(ranks)):
-                    assert inv_ranks[r] == 0
-                    inv_ranks[r] = i+1
-                assert min(inv_ranks) == 1
-                assert max(inv_ranks) == ranks.shape[0]
-                i = 0
-                fh.write('feature,importance,rank\n')
-                for im, r in zip(model.feature_importances_, inv_ranks):
-                    fh.write('%s,%0.4f,%d\n' % (self.col_names[ds][i], im, r))
-                    i += 1
+            assert len(self.col_names[ds]) == len(model.feature_importances_)
+            ranks = np.argsort(model.feature_importances_)[::-1]
+            inv_ranks = [0] * ranks.shape[0]
+            for i, r in enumerate(np.nditer(ranks)):
+                assert inv_ranks[r] == 0
+                inv_ranks[r] = i+1
+            assert min(inv_ranks) == 1
+            assert max(inv_ranks) == ranks.shape[0]
+            importance = pandas.DataFrame.from_dict({'feature': self.col_names[ds],
+                                                     'importance': model.feature_importances_,
+                                                     'rank': inv_ranks})
+            importance.to_csv(prefix + '_' + ds + '.csv', sep=',', index=False,
+                              encoding='utf-8', float_format='%0.4f')
 
     def write_parameters(self, prefix):
         """
@@ -111,6 +111,4 @@ class Hisat2(Aligner):
                           stdin=popen_stdin, stdout=popen_stdout, stderr=popen_stderr,
                           bufsize=-1, close_fds='posix' in sys.builtin_module_names)
 
-    @staticmethod
-    def supports_mix():
-        return True
+    supports_mix = True
@@ -72,28 +72,32 @@ class MetaMat(object):
         self.cur = 0
         self.done = False
 
+    @staticmethod
+    def write_meta(fn, col_names, n_row):
+        """ Write a one-line .meta file: comma-separated column names
+            followed by the number of rows """
+        col_names = [c if isinstance(c, bytes) else c.encode() for c in col_names]
+        with open(fn, 'wb') as ofh:
+            ofh.write(b','.join(col_names + [str(n_row).encode()]))
+
     @staticmethod
     def write_metamat(prefix, col_names, floats=None, append=False):
-        """ Caution: this doesn't use numpy tofile, and so is slow for writing
-            lots of floats """
+        """ Write metadata and data files for the given column names and
+            flattened row-major float data """
         if not append:
-            with open(prefix + '.meta', 'wb') as ofh:
-                n_col = len(col_names)
-                assert len(floats) % n_col == 0
-                n_row = len(floats) // n_col
-                ofh.write(b','.join(col_names + [str(n_row).encode()]))
+            n_col = len(col_names)
+            assert len(floats) % n_col == 0
+            MetaMat.write_meta(prefix + '.meta', col_names, len(floats) // n_col)
 
         if floats is not None:
             with open(prefix + '.npy', 'ab' if append else 'wb') as ofh:
-                for f in floats:
-                    ofh.write(struct.pack('d', f))
+                numpy.asarray(floats, dtype=numpy.float64).tofile(ofh)
 
 
 if __name__ == "__main__":
 
     import sys
     import unittest
-    import struct
 
 
     class TestCases(unittest.TestCase):
@@ -7,10 +7,6 @@ MapqPredictions class for storing and analyzing predictions.
 import pandas
 import logging
 from collections import Counter
-try:
-    from itertools import izip
-except ImportError:
-    izip = zip
 
 from roc import Roc
 from metamat import MetaMat
@@ -112,9 +108,12 @@ class MapqPredictions:
         if self.has_correct:
             assert mapq_orig is not None
             assert correct is not None
-            self.tally.update(zip(mapq.round(decimals=self.mapq_precision), correct))
-            self.tally_orig.update(zip(mapq_orig, correct))
-            self.tally_rounded.update(zip(mapq.round(decimals=0), correct))
+            # materialize each column as plain Python scalars once, rather
+            # than letting zip box a numpy scalar per element per tally
+            correct_l = correct.tolist()
+            self.tally.update(zip(mapq.round(decimals=self.mapq_precision).tolist(), correct_l))
+            self.tally_orig.update(zip(mapq_orig.tolist(), correct_l))
+            self.tally_rounded.update(zip(mapq.round(decimals=0).tolist(), correct_l))
 
     def _load_predictions(self):
         """ Load all the predictions added with the 'add' member function into
@@ -186,17 +185,11 @@ class MapqPredictions:
         # Write metadata for the prediction files
         columns = ['ids', 'mapq']
         for fn, n_row in zip(self.pred_meta_fns, self.pred_nrow):
-            with open(fn, 'wb') as fh:
-                fh.write(b','.join(map(lambda x: x.encode(), columns)))
-                fh.write(b',')
-                fh.write(str(n_row).encode())
+            MetaMat.write_meta(fn, columns, n_row)
         if self.calc_summaries:
             # Write metadata for the assessment files
             for fn, n_row in zip(self.assess_meta_fns, self.assess_nrow):
-                with open(fn, 'wb') as fh:
-                    fh.write(b','.join(map(lambda x: x.encode(), self.assess_columns)))
-                    fh.write(b',')
-                    fh.write(str(n_row).encode())
+                MetaMat.write_meta(fn, self.assess_columns, n_row)
 
         log.info('  %d records written to %d files' % (self.npredictions, len(self.pred_fns)))
 
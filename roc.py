@@ -33,62 +33,59 @@ class Roc(object):
             pcor = mapqs
             mapqs = pcor_to_mapq_np(mapqs)
         cors, incors = zip(*tups)
+        cors = numpy.fromiter(cors, numpy.int_, count=len(tups))
+        incors = numpy.fromiter(incors, numpy.int_, count=len(tups))
+        n = cors + incors
+        se = incors * pcor * pcor + cors * (1.0 - pcor) * (1.0 - pcor)
         self.tab = pandas.DataFrame.from_dict({'mapq': mapqs,
                                                'pcor': pcor,
                                                'cor': cors,
                                                'incor': incors,
                                                'cum_cor': numpy.cumsum(cors),
-                                               'cum_incor': numpy.cumsum(incors)})
-        self.tab['n'] = self.tab['cor'] + self.tab['incor']
-        self.tab['cum'] = self.tab['cum_cor'] + self.tab['cum_incor']
-        self.tab['se'] = self.tab['incor'] * self.tab['pcor'] * self.tab['pcor'] + \
-                         self.tab['cor'] * (1.0 - self.tab['pcor']) * (1.0 - self.tab['pcor'])
-        self.tab['cum_se'] = self.tab['se'].cumsum()
-        self.tot = self.tab['n'].sum()
+                                               'cum_incor': numpy.cumsum(incors),
+                                               'n': n,
+                                               'cum': numpy.cumsum(n),
+                                               'se': se,
+                                               'cum_se': numpy.cumsum(se)})
+        self.tot = n.sum()
 
     def cum_incorrect_and_error(self):
         """
         Take two ROC tables.  Return vectors corresponding to the CID and CSED
         curves.
         """
-        ci, ce = [0], [0]
-        for idx, row in self.tab.iterrows():
-            incor_incr = row['incor'] / float(row['n'])
-            se_incr = row['se'] / float(row['n'])
-            for i in range(int(row['n'])):
-                ci.append(ci[-1] + incor_incr)
-                ce.append(ce[-1] + se_incr)
-        return ci, ce
+        n = self.tab['n'].values.astype(int)
+        incor_incr = self.tab['incor'].values / n.astype(float)
+        se_incr = self.tab['se'].values / n.astype(float)
+        ci = numpy.concatenate(([0.0], numpy.cumsum(numpy.repeat(incor_incr, n))))
+        ce = numpy.concatenate(([0.0], numpy.cumsum(numpy.repeat(se_incr, n))))
+        return ci.tolist(), ce.tolist()
 
     @staticmethod
     def write_cum_incorrect_diff(roc1, roc2, fn):
         with open(fn, 'wb') as fh:
             ci1l, _ = roc1.cum_incorrect_and_error()
             ci2l, _ = roc2.cum_incorrect_and_error()
-            for ci1, ci2 in zip(ci1l, ci2l):
-                fh.write(str(ci1 - ci2) + '\n')
+            lns = '\n'.join(str(ci1 - ci2) for ci1, ci2 in zip(ci1l, ci2l))
+            fh.write((lns + '\n').encode('utf-8'))
 
     @staticmethod
     def write_cum_squared_error(roc1, roc2, fn):
         with open(fn, 'wb') as fh:
             _, csel1 = roc1.cum_incorrect_and_error()
             _, csel2 = roc2.cum_incorrect_and_error()
-            for cse1, cse2 in zip(csel1, csel2):
-                fh.write(str(cse1 - cse2) + '\n')
+            lns = '\n'.join(str(cse1 - cse2) for cse1, cse2 in zip(csel1, csel2))
+            fh.write((lns + '\n').encode('utf-8'))
 
     def area_under_cumulative_incorrect(self):
         """
         Return area under the cumulative incorrect curve, accumulated from
         high to low mapping quality.
         """
-        cum, auc = 0, 0.0
-        for idx, row in self.tab.iterrows():
-            ic, n = int(row['incor']), int(row['n'])
-            height = cum + ic/2.0
-            width = n
-            auc += height * width
-            cum += ic
-        return auc
+        ic = self.tab['incor'].values.astype(int)
+        n = self.tab['n'].values.astype(int)
+        heights = numpy.cumsum(ic) - ic + ic/2.0
+        return float(numpy.sum(heights * n))
 
     def sum_of_squared_error(self):
         """
@@ -178,11 +178,7 @@ class SnapAligner(Aligner):
                           stdin=popen_stdin, stdout=popen_stdout, stderr=popen_stderr,
                           bufsize=-1, close_fds='posix' in sys.builtin_module_names)
 
-    @staticmethod
-    def supports_mix():
-        """
-        Note: return value of true doesn't just mean it can take some unpaired
-        and some paired in a given invocation; it also means that can be
-        interleaved in the input.
-        """
-        return False
+    # Note: supports_mix=True wouldn't just mean SNAP can take some unpaired
+    # and some paired reads in a given invocation; it would also mean they
+    # can be interleaved in the input
+    supports_mix = False